@@ -4,8 +4,45 @@ Implements business logic layer following MVC architecture.
 Handles data validation and coordinates between View and Model layers.
 """
 
+import functools
+import logging
+import re
+import sqlite3
+import unicodedata
+
 from database import DatabaseManager
 
+logger = logging.getLogger(__name__)
+
+# Splits text into words the way SQLite's FTS5 unicode61 tokenizer does:
+# runs of letters and digits (unlike \w, '_' separates words)
+_WORD_RE = re.compile(r'[^\W_]+')
+
+def _search_words(text):
+    """
+    Lowercases text, strips accents and splits it into words, matching the
+    database's 'unicode61 remove_diacritics 2' full-text tokenizer.
+    
+    Returns:
+        list: Words of the text
+    """
+    # Canonical decomposition only: like the tokenizer, keep ligatures and
+    # full-width or superscript characters as they are (NFKD would fold them)
+    decomposed = unicodedata.normalize('NFD', text.lower())
+    return _WORD_RE.findall(''.join(ch for ch in decomposed if not unicodedata.combining(ch)))
+
+def _narrowable(keyword):
+    """
+    Checks if the controller's in-memory narrowing gives the same results
+    as the full-text search for this keyword. That holds when each
+    whitespace-separated term is at most one word: a term such as
+    'beta-al' is searched as a phrase, which narrowing cannot reproduce.
+    
+    Returns:
+        bool: True if every term has at most one word
+    """
+    return all(len(_search_words(term)) <= 1 for term in keyword.split())
+
 class ComponentController:
     """
     Controller layer that manages business logic and data flow.
@@ -19,6 +56,16 @@ class ComponentController:
         This follows MVC pattern where Controller has reference to Model.
         """
         self.db = DatabaseManager()  # Model layer instance
+        
+        # Last search, reused when the user extends the keyword by typing
+        self._last_key = None
+        self._last_result = None
+        # Normalized words of each component's name/description, by component_id
+        self._words_by_id = {}
+        # Recent searches, reused when a query is repeated exactly. The
+        # strict search raises on database errors, so failures (e.g. a busy
+        # database) are never cached as "no results"
+        self._search_cache = functools.lru_cache(maxsize=32)(self.db.search_components_strict)
     
     def add_component(self, name, pattern_name, pattern_category, language, 
                      description, code_snippet, author):
@@ -26,11 +73,11 @@ class ComponentController:
         Add a new component with comprehensive validation.
         Implements validation rules from Section 4.2 Interface Design Rules.
         
-        Validation checks:
-        1. Component name cannot be empty
-        2. Code snippet cannot be empty
-        3. Pattern type must be selected
-        4. Programming language must be selected
+        Validation checks (cheapest first):
+        1. Pattern type must be selected
+        2. Programming language must be selected
+        3. Component name cannot be empty
+        4. Code snippet cannot be empty
         
         Args:
             name (str): Component name
@@ -47,55 +94,195 @@ class ComponentController:
                    message: User-friendly status message
         """
         # === VALIDATION SECTION ===
-        # Check 1: Component name is required
-        if not name or not name.strip():
-            return False, "Component name is required."
+        error, row = self._prepare_component(name, pattern_name, pattern_category,
+                                             language, description, code_snippet, author)
+        if error:
+            return False, error
         
-        # Check 2: Code snippet is required
-        if not code_snippet or not code_snippet.strip():
-            return False, "Code snippet is required."
+        # === DATABASE OPERATION ===
+        # All validation passed, proceed with database insertion
+        success = self.db.insert_component(*row)
         
-        # Check 3: Pattern type must be selected
-        if not pattern_name:
-            return False, "Pattern type is required."
+        # === RESPONSE HANDLING ===
+        if success:
+            self._invalidate_search_cache()
+            return True, "Component saved successfully!"
+        else:
+            return False, "Database error occurred."
+    
+    def add_components_bulk(self, components):
+        """
+        Add many components at once (e.g. importing or seeding a library).
+        Every entry is validated first; if all pass, they are written in a
+        single database transaction.
         
-        # Check 4: Programming language must be selected
-        if not language:
-            return False, "Programming language is required."
+        Args:
+            components (list): Dictionaries with the same keys as the
+                               add_component arguments
+        
+        Returns:
+            tuple: (success: bool, message: str)
+                   success: True if every component was added, False otherwise
+                   message: User-friendly status message
+        """
+        # === VALIDATION SECTION ===
+        rows = []
+        # Local bindings: avoid repeated attribute lookups inside the loop
+        prepare = self._prepare_component
+        append_row = rows.append
+        for index, comp in enumerate(components, start=1):
+            error, row = prepare(
+                comp.get('name'), comp.get('pattern_name'), comp.get('pattern_category', ''),
+                comp.get('language'), comp.get('description', ''),
+                comp.get('code_snippet'), comp.get('author', ''))
+            if error:
+                return False, f"Component {index}: {error}"
+            append_row(row)
         
         # === DATABASE OPERATION ===
-        # All validation passed, proceed with database insertion
-        success = self.db.insert_component(
-            name.strip(),           # Remove extra whitespace
-            pattern_name, 
-            pattern_category, 
-            language, 
-            description.strip(),    # Clean description
-            code_snippet.strip(),   # Clean code snippet
-            author.strip()          # Clean author name
-        )
+        if not rows:
+            return False, "No components to add."
+        success = self.db.insert_components_bulk(rows)
         
         # === RESPONSE HANDLING ===
         if success:
-            return True, "Component saved successfully!"
+            self._invalidate_search_cache()
+            return True, f"{len(rows)} components saved successfully!"
         else:
             return False, "Database error occurred."
     
-    def search_components(self, keyword="", pattern_filter="", language_filter=""):
+    def _prepare_component(self, name, pattern_name, pattern_category, language,
+                           description, code_snippet, author):
+        """
+        Applies the validation rules from Section 4.2 Interface Design Rules
+        and cleans the text fields for insertion.
+        
+        Cheap selection checks run first, and each text field is stripped
+        only once, with the stripped value reused for the insert.
+        
+        Returns:
+            tuple: (error: str, row: tuple)
+                   error: Message for the first failed check, or None if valid
+                   row: Cleaned insert_component arguments, or None on error
+        """
+        # Check 1: Pattern type must be selected
+        if not pattern_name:
+            return "Pattern type is required.", None
+        
+        # Check 2: Programming language must be selected
+        if not language:
+            return "Programming language is required.", None
+        
+        # Check 3: Component name is required (remove extra whitespace)
+        name = name.strip() if name else ""
+        if not name:
+            return "Component name is required.", None
+        
+        # Check 4: Code snippet is required
+        code_snippet = code_snippet.strip() if code_snippet else ""
+        if not code_snippet:
+            return "Code snippet is required.", None
+        
+        return None, (
+            name,
+            pattern_name,
+            pattern_category,
+            language,
+            (description or "").strip(),  # Clean description (may be None)
+            code_snippet,
+            (author or "").strip()        # Clean author name (may be None)
+        )
+    
+    def search_components(self, keyword="", pattern_filter="", language_filter="",
+                          limit=None, offset=0):
         """
         Search for components using multiple filter criteria.
-        Delegates search logic to DatabaseManager.
+        Delegates search logic to DatabaseManager, with two shortcuts for
+        the GUI's search-as-you-type:
+        
+        1. If the keyword only extends the previous keyword (same filters,
+           no paging: no limit and offset 0), the new results are a subset of the previous ones,
+           so they are filtered in memory instead of querying again.
+        2. Exactly repeated searches are served from a small LRU cache.
         
         Args:
             keyword (str): Search term for name/description
             pattern_filter (str): Filter by pattern type
             language_filter (str): Filter by programming language
+            limit (int): Maximum number of components to return (None for all)
+            offset (int): Number of matching components to skip (for paging)
         
         Returns:
-            list: Component dictionaries matching search criteria
+            list: Component rows (sqlite3.Row) matching search criteria
+        """
+        key = (keyword, pattern_filter, language_filter, limit, offset)
+        last_key = self._last_key
+        
+        # Narrowing is only safe when the previous results really contain
+        # every match: the previous keyword was empty or had words (a
+        # punctuation-only keyword matches nothing), and both keywords
+        # follow the one-word-per-term rule narrowing implements
+        if (self._last_result is not None
+                and limit is None
+                and offset == 0
+                and key[1:] == last_key[1:]
+                and keyword != last_key[0]
+                and keyword.startswith(last_key[0])
+                and (_search_words(last_key[0]) or not last_key[0].strip())
+                and _narrowable(last_key[0])
+                and _narrowable(keyword)):
+            # Narrow the previous results in memory, using the same rule as
+            # the full-text search: every typed word starts some word in
+            # the name or description
+            prefixes = _search_words(keyword)
+            if not prefixes and keyword.strip():
+                # Punctuation-only keywords never match in full-text search
+                results = []
+            else:
+                # Bound once: this runs for every cached row on every keystroke
+                matches = self._matches_prefixes
+                results = [c for c in self._last_result if matches(c, prefixes)]
+        else:
+            # Delegate search to Model layer (DatabaseManager)
+            try:
+                results = self._search_cache(keyword, pattern_filter, language_filter,
+                                             limit, offset)
+            except sqlite3.Error as e:
+                # Nothing is remembered, so the next search queries again
+                logger.error("Database Error: %s", e)
+                self._last_key = None
+                self._last_result = None
+                return []
+        
+        self._last_key = key
+        self._last_result = results
+        # The cached list is shared with later searches; callers get a copy
+        return list(results)
+    
+    def _matches_prefixes(self, component, prefixes):
+        """
+        Checks if every prefix starts some word of the component's
+        name or description. The normalized words are computed once per
+        component and reused on every following keystroke.
+        
+        Returns:
+            bool: True if the component matches all prefixes
+        """
+        words = self._words_by_id.get(component['component_id'])
+        if words is None:
+            text = f"{component['name']} {component['description'] or ''}"
+            words = self._words_by_id[component['component_id']] = _search_words(text)
+        return all(any(word.startswith(prefix) for word in words)
+                   for prefix in prefixes)
+    
+    def _invalidate_search_cache(self):
         """
-        # Delegate search to Model layer (DatabaseManager)
-        return self.db.search_components(keyword, pattern_filter, language_filter)
+        Drops cached search results after the data has changed.
+        """
+        self._last_key = None
+        self._last_result = None
+        self._words_by_id.clear()
+        self._search_cache.cache_clear()
     
     def delete_component(self, component_id):
         """
@@ -108,21 +295,61 @@ class ComponentController:
         Returns:
             tuple: (success: bool, message: str)
         """
-        # Convert to int if string provided
-        if isinstance(component_id, str):
+        # Ints (the common case from the GUI) are bound as-is; anything else
+        # is converted once so bad IDs still get a clear message
+        if not isinstance(component_id, int):
             try:
                 component_id = int(component_id)
-            except ValueError:
+            except (TypeError, ValueError):
                 return False, "Invalid component ID."
         
         # Attempt deletion
         success = self.db.delete_component(component_id)
         
         if success:
+            self._invalidate_search_cache()
             return True, "Component deleted successfully!"
         else:
             return False, "Error deleting component."
     
+    def list_components(self):
+        """
+        Get every component for listing, straight from the model.
+        Unlike search_components this bypasses the search caches, so it
+        is safe to call from a worker thread while the data changes.
+        
+        Returns:
+            list: All component rows (sqlite3.Row), ordered by ID
+        """
+        return self.db.search_components()
+    
+    def get_component(self, component_id):
+        """
+        Get a single component by its unique ID.
+        
+        Args:
+            component_id (int/str): ID of component to fetch
+        
+        Returns:
+            sqlite3.Row: The component record, or None if the ID is invalid
+                         or no such component exists
+        """
+        # Same ID handling as delete_component
+        if not isinstance(component_id, int):
+            try:
+                component_id = int(component_id)
+            except (TypeError, ValueError):
+                return None
+        
+        return self.db.get_component(component_id)
+    
+    def close(self):
+        """
+        Releases the Model's database connections.
+        The controller must not be used after calling this method.
+        """
+        self.db.close()
+    
     def get_all_components(self):
         """
         Get all components (primarily for testing purposes).
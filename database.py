@@ -4,8 +4,99 @@ Handles all SQLite database operations using MVC architecture.
 Follows design specification from Section 3.2.3 for database interaction.
 """
 
+import logging
+import queue
 import sqlite3
-from datetime import datetime
+import threading
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Prepared statements kept per connection by the sqlite3 module. Every SQL
+# string used here stays cached, so repeated queries skip SQLite's
+# parse/plan step; the hot ones are prepared up front in __init__.
+_STATEMENT_CACHE_SIZE = 256
+
+# Per-connection tuning applied to the writer and every pooled reader.
+# busy_timeout makes SQLite itself wait (in C) for a lock held by another
+# connection before reporting "database is locked".
+_CONNECTION_PRAGMAS = """
+PRAGMA busy_timeout=5000;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-64000;
+PRAGMA mmap_size=268435456;
+"""
+
+# INSERT statement shared by single and bulk inserts.
+# date_added is filled in by SQLite (local date, YYYY-MM-DD).
+_INSERT_SQL = """
+INSERT INTO components
+(name, pattern_name, pattern_category, language, description,
+ code_snippet, author, date_added)
+VALUES (?, ?, ?, ?, ?, ?, ?, date('now', 'localtime'))
+"""
+
+_DELETE_SQL = "DELETE FROM components WHERE component_id = ?"
+
+# Single component by primary key (all columns)
+_GET_SQL = """
+SELECT component_id, name, pattern_name, pattern_category, language,
+       description, code_snippet, author, date_added
+FROM components
+WHERE component_id = ?
+"""
+
+# Full-text tokenizer: Unicode-aware words, case and accent insensitive
+_FTS_TOKENIZER = "unicode61 remove_diacritics 2"
+
+# Columns the GUI needs for the component list (the details pane loads the
+# full record by ID, see get_component)
+_DISPLAY_COLUMNS = ", ".join(f"components.{column}" for column in (
+    "component_id", "name", "pattern_name", "language", "description"))
+
+# Search statements. A filter whose parameter is NULL is switched off, so
+# the SQL text never changes and each prepared statement is reused.
+# Searches without a keyword scan the components table:
+_SEARCH_SQL = f"""
+SELECT {_DISPLAY_COLUMNS}
+FROM components
+WHERE (?2 IS NULL OR pattern_name = ?2)
+  AND (?3 IS NULL OR language = ?3)
+ORDER BY component_id
+LIMIT ?4 OFFSET ?5
+"""
+
+# Keyword searches start from the full-text index and join the matches:
+_SEARCH_FTS_SQL = f"""
+SELECT {_DISPLAY_COLUMNS}
+FROM components_fts
+JOIN components ON components.component_id = components_fts.rowid
+WHERE components_fts MATCH ?1
+  AND (?2 IS NULL OR components.pattern_name = ?2)
+  AND (?3 IS NULL OR components.language = ?3)
+ORDER BY components.component_id
+LIMIT ?4 OFFSET ?5
+"""
+
+# Attempts for a write transaction that still finds the database busy
+# after busy_timeout; retries back off 5ms, 10ms, 20ms, 40ms
+_WRITE_ATTEMPTS = 5
+
+# Rows pulled from SQLite per fetchmany() call when streaming results
+_FETCH_BATCH_SIZE = 256
+
+def _fts_query(keyword):
+    """
+    Turns a user-typed keyword into a safe FTS5 MATCH expression.
+    Each word is quoted (so punctuation is never parsed as FTS syntax) and
+    prefix-matched, so partially typed words still find results.
+    
+    Returns:
+        str: MATCH expression, or empty string if there is nothing to match
+    """
+    terms = ['"{}"*'.format(word.replace('"', '""')) for word in keyword.split()]
+    return " ".join(terms)
 
 class DatabaseManager:
     """
@@ -13,17 +104,105 @@ class DatabaseManager:
     Implements CRUD operations and follows the 'workhorse' function pattern.
     """
     
-    def __init__(self, db_name="component_librarian.db"):
+    # Database files (absolute paths) whose schema was already created by
+    # this process, so further instances can skip the DDL round-trips
+    _schema_ready = set()
+    
+    def __init__(self, db_name="component_librarian.db", read_pool_size=4):
         """
-        Initialize database connection and create tables if they don't exist.
+        Initialize database connections and create tables if they don't exist.
+        The schema is only created once per database file per process.
+        
+        One long-lived write connection handles INSERT/DELETE/DDL, while a
+        small pool of read-only connections serves SELECT queries so that
+        concurrent searches do not queue behind each other.
         
         Args:
             db_name (str): Name of the SQLite database file. 
                           Defaults to 'component_librarian.db'
+            read_pool_size (int): Number of read-only connections to open
+                          (at least 1). Defaults to 4
+        
+        Raises:
+            ValueError: If read_pool_size is less than 1
         """
+        # Readers block until a pooled connection is free, so an empty pool
+        # would hang the first query forever
+        if read_pool_size < 1:
+            raise ValueError("read_pool_size must be at least 1")
+        
         self.db_name = db_name
-        # Create the components table on initialization
-        self.create_table()
+        db_path = Path(self.db_name).resolve()
+        # A missing file always needs its schema, even if it was deleted
+        # after an earlier instance created it
+        schema_needed = str(db_path) not in self._schema_ready or not db_path.exists()
+        # Single writer connection shared by all write queries (autocommit mode)
+        self._write_conn = sqlite3.connect(self.db_name, check_same_thread=False,
+                                           isolation_level=None,
+                                           cached_statements=_STATEMENT_CACHE_SIZE)
+        # Serializes access to the writer across threads
+        self._write_lock = threading.Lock()
+        # Tune the writer: WAL journal, fewer fsyncs, larger page cache
+        self._write_conn.executescript("""
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        """ + _CONNECTION_PRAGMAS)
+        # Create the components table on first use of this database file
+        if schema_needed:
+            self.create_table()
+            DatabaseManager._schema_ready.add(str(db_path))
+        
+        # Read-only connections, handed out one caller at a time
+        read_uri = db_path.as_uri() + "?mode=ro"
+        self._read_pool = queue.Queue()
+        for _ in range(read_pool_size):
+            conn = sqlite3.connect(read_uri, uri=True, check_same_thread=False,
+                                   cached_statements=_STATEMENT_CACHE_SIZE)
+            conn.executescript(_CONNECTION_PRAGMAS)
+            # sqlite3.Row gives name-based access without building a dict per row
+            conn.row_factory = sqlite3.Row
+            self._read_pool.put(conn)
+        
+        # Prepare the hot statements now rather than on the first keystroke
+        self._warm_statements()
+    
+    def _warm_statements(self):
+        """
+        Runs each frequently used statement once without any effect so the
+        sqlite3 statement cache of every connection already holds it.
+        Searches use LIMIT 0 and the lookup by ID a NULL ID; the writer's
+        INSERT and DELETE run inside a transaction that is rolled back.
+        Failures are harmless and ignored.
+        """
+        try:
+            for _ in range(self._read_pool.qsize()):
+                conn = self._read_pool.get()
+                try:
+                    for sql in (_SEARCH_SQL, _SEARCH_FTS_SQL):
+                        conn.execute(sql, (None, None, None, 0, 0)).fetchall()
+                    conn.execute(_GET_SQL, (None,)).fetchall()
+                finally:
+                    self._read_pool.put(conn)
+            
+            with self._write_lock:
+                self._write_conn.execute("BEGIN IMMEDIATE")
+                try:
+                    self._write_conn.execute(_INSERT_SQL, ("",) * 7)
+                    self._write_conn.execute(_DELETE_SQL, (None,))
+                finally:
+                    self._write_conn.execute("ROLLBACK")
+        except sqlite3.Error as e:
+            logger.debug("Statement warm-up skipped: %s", e)
+    
+    def close(self):
+        """
+        Closes the writer and every pooled read connection.
+        The manager must not be used after calling this method.
+        """
+        with self._write_lock:
+            self._write_conn.close()
+        while not self._read_pool.empty():
+            self._read_pool.get_nowait().close()
     
     def create_table(self):
         """
@@ -40,6 +219,11 @@ class DatabaseManager:
         - author: Creator of the component
         - date_added: Automatic timestamp
         
+        Also creates the search support structures:
+        - B-tree indexes on pattern_name and language for exact-match filters
+        - components_fts: FTS5 full-text index over name and description,
+          kept in sync with the components table by triggers
+        
         Uses SQLite's 'IF NOT EXISTS' to avoid errors on re-creation.
         """
         sql = """
@@ -57,6 +241,65 @@ class DatabaseManager:
         """
         # Execute the table creation query
         self.execute_query(sql, is_select=False)
+        
+        # Indexes for the exact-match search filters
+        self.execute_query("CREATE INDEX IF NOT EXISTS idx_pattern ON components(pattern_name)",
+                           is_select=False)
+        self.execute_query("CREATE INDEX IF NOT EXISTS idx_language ON components(language)",
+                           is_select=False)
+        
+        # Full-text index for keyword search (external content: no data copy)
+        fts_sql = self._table_sql("components_fts")
+        if fts_sql is not None and _FTS_TOKENIZER not in fts_sql:
+            # Built with an older tokenizer: recreate and re-index below
+            self.execute_query("DROP TABLE components_fts", is_select=False)
+            fts_sql = None
+        schema = [
+            f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS components_fts
+            USING fts5(name, description, content='components', content_rowid='component_id',
+                       tokenize='{_FTS_TOKENIZER}')
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS components_fts_insert AFTER INSERT ON components BEGIN
+                INSERT INTO components_fts(rowid, name, description)
+                VALUES (new.component_id, new.name, new.description);
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS components_fts_delete AFTER DELETE ON components BEGIN
+                INSERT INTO components_fts(components_fts, rowid, name, description)
+                VALUES ('delete', old.component_id, old.name, old.description);
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS components_fts_update AFTER UPDATE ON components BEGIN
+                INSERT INTO components_fts(components_fts, rowid, name, description)
+                VALUES ('delete', old.component_id, old.name, old.description);
+                INSERT INTO components_fts(rowid, name, description)
+                VALUES (new.component_id, new.name, new.description);
+            END
+            """,
+        ]
+        for statement in schema:
+            self.execute_query(statement, is_select=False)
+        if fts_sql is None:
+            # Index components stored before this version of the index existed
+            self.execute_query("INSERT INTO components_fts(components_fts) VALUES ('rebuild')",
+                               is_select=False)
+    
+    def _table_sql(self, table_name):
+        """
+        Looks up a table's CREATE statement, using the writer connection so
+        it also works before the read pool has been opened.
+        
+        Returns:
+            str: The table's SQL, or None if the table does not exist
+        """
+        with self._write_lock:
+            row = self._write_conn.execute(
+                "SELECT sql FROM sqlite_master WHERE name = ?", (table_name,)).fetchone()
+        return row[0] if row else None
     
     def execute_query(self, sql_query, params=(), is_select=False):
         """
@@ -64,10 +307,10 @@ class DatabaseManager:
         Handles all SQL operations with proper connection management and error handling.
         
         Features:
-        1. Automatic connection opening/closing (context manager)
+        1. Routes SELECTs to the read pool and everything else to the writer
         2. Parameterized queries to prevent SQL injection
         3. Error handling with informative messages
-        4. Returns dictionary results for SELECT queries
+        4. Returns sqlite3.Row results for SELECT queries
         
         Args:
             sql_query (str): SQL query to execute
@@ -75,33 +318,117 @@ class DatabaseManager:
             is_select (bool): True for SELECT queries, False for INSERT/UPDATE/DELETE
         
         Returns:
-            - For SELECT: List of dictionaries (each row as dict)
+            - For SELECT: List of sqlite3.Row (access columns by name, e.g. row['name'])
             - For other queries: Boolean success indicator
             - On error: Empty list (for SELECT) or False (for other)
         """
         try:
-            # Context manager automatically handles connection open/close
-            with sqlite3.connect(self.db_name) as conn:
-                cursor = conn.cursor()
-                # Execute with parameters (prevents SQL injection)
-                cursor.execute(sql_query, params)
-                
-                if is_select:
-                    # Get column names for dictionary conversion
-                    columns = [col[0] for col in cursor.description]
-                    results = cursor.fetchall()
-                    # Convert each row to dictionary with column names as keys
-                    return [dict(zip(columns, row)) for row in results]
-                else:
-                    # Commit changes for INSERT/UPDATE/DELETE
-                    conn.commit()
-                    return True
+            if is_select:
+                return self._execute_read(sql_query, params)
+            else:
+                return self._execute_write(sql_query, params)
         except sqlite3.Error as e:
             # Log database errors for debugging
-            print(f"Database Error: {e}")
+            logger.error("Database Error: %s", e)
             # Return appropriate failure value
             return False if not is_select else []
     
+    def _execute_read(self, sql_query, params=()):
+        """
+        Runs a SELECT on a connection borrowed from the read pool.
+        
+        Returns:
+            list: List of sqlite3.Row objects
+        """
+        conn = self._read_pool.get()
+        try:
+            # Execute with parameters (prevents SQL injection)
+            cursor = conn.execute(sql_query, params)
+            # Rows come back as sqlite3.Row (row_factory set on the pool)
+            return cursor.fetchall()
+        finally:
+            # Always hand the connection back, even on error
+            self._read_pool.put(conn)
+    
+    def iter_query(self, sql_query, params=()):
+        """
+        Streams the rows of a SELECT instead of building the full result list,
+        so peak memory stays at one batch of rows.
+        
+        The read connection is held until the generator is exhausted or
+        closed, so callers should not leave it half-consumed.
+        
+        Args:
+            sql_query (str): SELECT query to execute
+            params (tuple): Query parameters for safe substitution
+        
+        Yields:
+            sqlite3.Row: One row at a time, fetched in batches
+        """
+        conn = self._read_pool.get()
+        try:
+            cursor = conn.execute(sql_query, params)
+            while True:
+                rows = cursor.fetchmany(_FETCH_BATCH_SIZE)
+                if not rows:
+                    return
+                yield from rows
+        except sqlite3.Error as e:
+            # Log database errors for debugging; the stream simply ends
+            logger.error("Database Error: %s", e)
+        finally:
+            # Always hand the connection back, even on error or early close
+            self._read_pool.put(conn)
+    
+    def _execute_write(self, sql_query, params=()):
+        """
+        Runs an INSERT/UPDATE/DELETE/DDL statement on the writer connection.
+        
+        Returns:
+            bool: True once the statement has been committed
+        """
+        # Only one writer at a time; SQLite allows a single write transaction
+        with self._write_lock:
+            # Execute with parameters (prevents SQL injection)
+            self._in_transaction(self._write_conn.execute, sql_query, params)
+            return True
+    
+    def _in_transaction(self, execute, sql_query, params):
+        """
+        Runs one execute/executemany call on the writer inside an explicit
+        BEGIN IMMEDIATE ... COMMIT, rolling back if anything fails.
+        The writer is in autocommit mode, so this is the only transaction
+        boundary; the caller must hold _write_lock.
+        
+        If the database stays busy or locked (another process holds the
+        write lock), the whole transaction is retried with a short backoff
+        so the user's change is not lost.
+        
+        Args:
+            execute (callable): self._write_conn.execute or .executemany
+            sql_query (str): SQL statement to run
+            params: Parameters for execute, or a sequence of them for executemany
+        """
+        conn = self._write_conn
+        for attempt in range(_WRITE_ATTEMPTS):
+            try:
+                # IMMEDIATE takes the write lock up front instead of on the first write
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    execute(sql_query, params)
+                    conn.execute("COMMIT")
+                except BaseException:
+                    if conn.in_transaction:
+                        conn.execute("ROLLBACK")
+                    raise
+                return
+            except sqlite3.OperationalError as e:
+                message = str(e)
+                if (attempt == _WRITE_ATTEMPTS - 1
+                        or ("locked" not in message and "busy" not in message)):
+                    raise
+                time.sleep(0.005 * (2 ** attempt))
+    
     def insert_component(self, name, pattern_name, pattern_category, language, 
                         description, code_snippet, author):
         """
@@ -120,55 +447,106 @@ class DatabaseManager:
         Returns:
             bool: True if successful, False otherwise
         """
-        sql = """
-        INSERT INTO components 
-        (name, pattern_name, pattern_category, language, description, 
-         code_snippet, author, date_added)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """
-        # Get current date in YYYY-MM-DD format
-        date_now = datetime.now().strftime("%Y-%m-%d")
         # Execute insert query with all parameters
-        return self.execute_query(sql, 
+        return self.execute_query(_INSERT_SQL, 
             (name, pattern_name, pattern_category, language, 
-             description, code_snippet, author, date_now), 
+             description, code_snippet, author), 
             is_select=False)
     
-    def search_components(self, keyword="", pattern_filter="", language_filter=""):
+    def insert_components_bulk(self, rows):
+        """
+        Adds many component records inside a single transaction.
+        Much faster than repeated insert_component calls because SQLite
+        only has to sync the journal once for the whole batch.
+        
+        Args:
+            rows (iterable): Tuples of (name, pattern_name, pattern_category,
+                             language, description, code_snippet, author)
+        
+        Returns:
+            bool: True if every row was inserted, False otherwise
+                  (on failure no rows are inserted)
+        """
+        params = [tuple(row) for row in rows]
+        try:
+            with self._write_lock:
+                # The whole batch shares one transaction
+                self._in_transaction(self._write_conn.executemany, _INSERT_SQL, params)
+                return True
+        except sqlite3.Error as e:
+            # Log database errors for debugging
+            logger.error("Database Error: %s", e)
+            return False
+    
+    def search_components(self, keyword="", pattern_filter="", language_filter="",
+                          limit=None, offset=0):
         """
         Search components with flexible filtering options.
         Supports keyword search and specific pattern/language filters.
         
         Args:
-            keyword (str): Search term for name or description (LIKE search)
+            keyword (str): Search term for name or description (full-text
+                           search, matching words that start with each term)
             pattern_filter (str): Filter by specific pattern type (exact match)
             language_filter (str): Filter by programming language (exact match)
+            limit (int): Maximum number of rows to return (None for all)
+            offset (int): Number of matching rows to skip (for paging)
         
         Returns:
-            list: List of component dictionaries matching criteria
+            list: List of component rows (sqlite3.Row) matching criteria
         """
-        # Start with base query (1=1 allows easy WHERE clause building)
-        query = "SELECT * FROM components WHERE 1=1"
-        parameters = []
+        return self.execute_query(
+            *self._search_query(keyword, pattern_filter, language_filter, limit, offset),
+            is_select=True)
+    
+    def search_components_strict(self, keyword="", pattern_filter="", language_filter="",
+                                 limit=None, offset=0):
+        """
+        Same as search_components, but database errors are raised instead
+        of being logged and turned into an empty list. For callers that
+        must tell "no matches" apart from a failed query (e.g. caches).
         
-        # Add keyword filter (searches both name and description)
-        if keyword:
-            query += " AND (name LIKE ? OR description LIKE ?)"
-            # Use wildcards for partial matching
-            parameters.extend([f'%{keyword}%', f'%{keyword}%'])
+        Returns:
+            list: List of component rows (sqlite3.Row) matching criteria
         
-        # Add pattern type filter
-        if pattern_filter:
-            query += " AND pattern_name = ?"
-            parameters.append(pattern_filter)
+        Raises:
+            sqlite3.Error: If the query fails
+        """
+        return self._execute_read(
+            *self._search_query(keyword, pattern_filter, language_filter, limit, offset))
+    
+    def iter_search_components(self, keyword="", pattern_filter="", language_filter="",
+                               limit=None, offset=0):
+        """
+        Streaming version of search_components for large result sets.
+        Takes the same arguments; see iter_query for how rows are delivered.
         
-        # Add programming language filter
-        if language_filter:
-            query += " AND language = ?"
-            parameters.append(language_filter)
+        Returns:
+            generator: Component rows (sqlite3.Row) matching criteria
+        """
+        return self.iter_query(
+            *self._search_query(keyword, pattern_filter, language_filter, limit, offset))
+    
+    def _search_query(self, keyword, pattern_filter, language_filter, limit, offset):
+        """
+        Picks the search statement and builds its parameters.
+        Absent filters are bound as NULL, which disables them in the query.
         
-        # Execute the dynamically built query
-        return self.execute_query(query, parameters, is_select=True)
+        Returns:
+            tuple: (sql: str, parameters: tuple)
+        """
+        match = _fts_query(keyword)
+        parameters = (
+            match or None,                  # Keyword (name and description)
+            pattern_filter or None,         # Pattern type
+            language_filter or None,        # Programming language
+            -1 if limit is None else limit, # LIMIT -1 means no limit in SQLite
+            offset
+        )
+        if match:
+            return _SEARCH_FTS_SQL, parameters
+        # _SEARCH_SQL never references the keyword parameter (?1)
+        return _SEARCH_SQL, parameters
     
     def delete_component(self, component_id):
         """
@@ -181,8 +559,21 @@ class DatabaseManager:
         Returns:
             bool: True if successful, False otherwise
         """
-        sql = "DELETE FROM components WHERE component_id = ?"
-        return self.execute_query(sql, (component_id,), is_select=False)
+        return self.execute_query(_DELETE_SQL, (component_id,), is_select=False)
+    
+    def get_component(self, component_id):
+        """
+        Implements a single-record READ from CRUD.
+        Looks up one component by its unique ID (primary key).
+        
+        Args:
+            component_id (int): The ID of the component to fetch
+        
+        Returns:
+            sqlite3.Row: The component record, or None if there is no such ID
+        """
+        rows = self.execute_query(_GET_SQL, (component_id,), is_select=True)
+        return rows[0] if rows else None
     
     def get_all_components(self):
         """
@@ -192,4 +583,20 @@ class DatabaseManager:
         Returns:
             list: All component records as dictionaries
         """
-        return self.execute_query("SELECT * FROM components", is_select=True)
\ No newline at end of file
+        return [dict(row) for row in self.get_all_components_raw()]
+    
+    def get_all_components_raw(self):
+        """
+        Streams every component as read-only sqlite3.Row objects, without
+        building a dictionary per row. Intended for bulk readers such as
+        exports; see iter_query for how rows are delivered.
+        
+        Returns:
+            generator: All component records as sqlite3.Row objects
+        """
+        sql = """
+        SELECT component_id, name, pattern_name, pattern_category, language,
+               description, code_snippet, author, date_added
+        FROM components
+        """
+        return self.iter_query(sql)
\ No newline at end of file
@@ -4,10 +4,37 @@ Tkinter-based user interface following MVC architecture.
 Implements the View layer with responsive design and user-friendly interactions.
 """
 
+import concurrent.futures
+import logging
+import queue
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 from controller import ComponentController
 
+logger = logging.getLogger(__name__)
+
+# Delay after the last keystroke before the search runs (milliseconds)
+SEARCH_DEBOUNCE_MS = 150
+
+# Rows moved per mouse-wheel notch in the component list
+WHEEL_SCROLL_ROWS = 3
+
+# Detached Treeview rows kept for reuse, in windows' worth of rows; beyond
+# that every row out of view is deleted, so the Treeview never grows to
+# the size of the whole library
+ROW_POOL_WINDOWS = 4
+
+# How often the Tk thread checks for finished background queries (milliseconds)
+RESULT_POLL_MS = 20
+
+# Longest part of a code snippet shown right away; the rest loads on request
+CODE_PREVIEW_CHARS = 64 * 1024
+
+# Combobox choices; '' (first entry) means "any" in the list filters
+PATTERN_VALUES = ('', 'Structural', 'Behavioral', 'Creational')
+LANGUAGE_VALUES = ('', 'C', 'C++', 'Python', 'Java', 'JavaScript')
+CATEGORY_VALUES = ('Container', 'Algorithm', 'Utility', 'Security', 'Other')
+
 class ComponentLibrarianGUI:
     """
     Main GUI class that implements the View layer of MVC.
@@ -36,12 +63,61 @@ class ComponentLibrarianGUI:
         # Store currently selected component ID for operations
         self.selected_component_id = None
         
+        # Every component (unfiltered), loaded on first use and reloaded
+        # after a component is added (None until the first load starts)
+        self._all_cache = None
+        # Controller queries run on a single worker thread (so they finish
+        # in order); finished futures come back through a queue that the
+        # Tk thread polls. Only the result of the latest request is used.
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._results = queue.Queue()
+        self._request_id = 0
+        self._pending_requests = 0
+        self._poll_after_id = None
+        # Components matching the current search, in display order, and
+        # all cached records keyed by component_id
+        self._filtered = []
+        self._component_by_id = {}
+        # The Treeview only holds the rows in view: index of the first one
+        # in self._filtered and how many fit in the widget
+        self._first_row = 0
+        self._window_rows = 0
+        # Treeview rows created so far (attached or detached) and the values
+        # each one currently shows, by component_id (str(component_id) is
+        # the row's iid)
+        self._row_values = {}
+        
+        # Pending debounced search (Tk 'after' id), if any
+        self._search_after_id = None
+        # Pending details update for the latest selection (after_idle id)
+        self._select_after_id = None
+        # Code snippet currently in the code area (possibly truncated there)
+        self._shown_snippet = ""
+        
+        # The Add Component dialog, built on first open and then reused
+        self._add_dialog = None
+        
         # Build the interface
         self.create_main_interface()
+        # Closing the main window also releases the worker and database
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         
         # Load initial component list
         self.refresh_component_list()
     
+    def on_close(self):
+        """
+        Called when the main window is closed. Stops pending callbacks,
+        waits for a running background load to finish (queued ones are
+        dropped), closes the database connections and destroys the window.
+        """
+        for after_id in (self._search_after_id, self._select_after_id, self._poll_after_id):
+            if after_id:
+                self.root.after_cancel(after_id)
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self.controller.close()
+        self.root.destroy()
+    
     def create_main_interface(self):
         """
         Creates the main application window with all UI components.
@@ -75,17 +151,17 @@ class ComponentLibrarianGUI:
         ttk.Label(filter_frame, text="Pattern:").grid(row=0, column=0, padx=(0, 5))
         self.pattern_var = tk.StringVar()
         self.pattern_combo = ttk.Combobox(filter_frame, textvariable=self.pattern_var, width=15)
-        self.pattern_combo['values'] = ['', 'Structural', 'Behavioral', 'Creational']
+        self.pattern_combo['values'] = PATTERN_VALUES
         self.pattern_combo.grid(row=0, column=1, padx=(0, 15))
-        self.pattern_combo.bind('<<ComboboxSelected>>', self.on_search_change)
+        self.pattern_combo.bind('<<ComboboxSelected>>', self.on_filter_change)
         
         # Language filter dropdown
         ttk.Label(filter_frame, text="Language:").grid(row=0, column=2, padx=(0, 5))
         self.language_var = tk.StringVar()
         self.language_combo = ttk.Combobox(filter_frame, textvariable=self.language_var, width=15)
-        self.language_combo['values'] = ['', 'C', 'C++', 'Python', 'Java', 'JavaScript']
+        self.language_combo['values'] = LANGUAGE_VALUES
         self.language_combo.grid(row=0, column=3, padx=(0, 15))
-        self.language_combo.bind('<<ComboboxSelected>>', self.on_search_change)
+        self.language_combo.bind('<<ComboboxSelected>>', self.on_filter_change)
         
         # Add Component button
         ttk.Button(filter_frame, text="Add Component", 
@@ -114,57 +190,71 @@ class ComponentLibrarianGUI:
         self.tree.grid(row=3, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S))
         
         # Scrollbar for treeview
-        scrollbar = ttk.Scrollbar(main_frame, orient=tk.VERTICAL, command=self.tree.yview)
-        scrollbar.grid(row=3, column=2, sticky=(tk.N, tk.S))
-        self.tree.configure(yscrollcommand=scrollbar.set)
+        # The list is virtualized (only visible rows exist in the Treeview),
+        # so the scrollbar drives self._first_row instead of tree.yview
+        self.scrollbar = ttk.Scrollbar(main_frame, orient=tk.VERTICAL,
+                                       command=self.on_scrollbar)
+        self.scrollbar.grid(row=3, column=2, sticky=(tk.N, tk.S))
         
         # Bind selection event to show details
         self.tree.bind('<<TreeviewSelect>>', self.on_component_select)
         
+        # Scrolling past the rendered rows moves the window over self._filtered
+        self.tree.bind('<Configure>', self.on_tree_configure)
+        self.tree.bind('<MouseWheel>', self.on_tree_wheel)   # Windows / macOS
+        self.tree.bind('<Button-4>', self.on_tree_wheel)     # X11 wheel up
+        self.tree.bind('<Button-5>', self.on_tree_wheel)     # X11 wheel down
+        self.tree.bind('<Up>', self.on_tree_arrow)
+        self.tree.bind('<Down>', self.on_tree_arrow)
+        self.tree.bind('<Prior>', self.on_tree_page)
+        self.tree.bind('<Next>', self.on_tree_page)
+        
         # === DETAILS SECTION ===
         details_frame = ttk.LabelFrame(main_frame, text="Component Details", padding="5")
         details_frame.grid(row=4, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(10, 0))
         details_frame.columnconfigure(1, weight=1)
         
-        # Component name display
-        ttk.Label(details_frame, text="Name:").grid(row=0, column=0, sticky=tk.W, pady=2)
-        self.detail_name = ttk.Label(details_frame, text="")
-        self.detail_name.grid(row=0, column=1, sticky=tk.W, pady=2)
-        
-        # Pattern type display
-        ttk.Label(details_frame, text="Pattern:").grid(row=1, column=0, sticky=tk.W, pady=2)
-        self.detail_pattern = ttk.Label(details_frame, text="")
-        self.detail_pattern.grid(row=1, column=1, sticky=tk.W, pady=2)
-        
-        # Language display
-        ttk.Label(details_frame, text="Language:").grid(row=2, column=0, sticky=tk.W, pady=2)
-        self.detail_language = ttk.Label(details_frame, text="")
-        self.detail_language.grid(row=2, column=1, sticky=tk.W, pady=2)
-        
-        # Description display
-        ttk.Label(details_frame, text="Description:").grid(row=3, column=0, sticky=tk.W, pady=2)
-        self.detail_description = ttk.Label(details_frame, text="")
-        self.detail_description.grid(row=3, column=1, sticky=tk.W, pady=2)
-        
-        # Author and date display
-        ttk.Label(details_frame, text="Author:").grid(row=4, column=0, sticky=tk.W, pady=2)
-        self.detail_author = ttk.Label(details_frame, text="")
-        self.detail_author.grid(row=4, column=1, sticky=tk.W, pady=2)
+        # Name, pattern, language, author/date and description, shown as
+        # lines of one read-only text widget (updated in a single pass).
+        # The description goes last since it may wrap or span several
+        # lines; the scrollbar reaches whatever does not fit.
+        self.detail_text = scrolledtext.ScrolledText(details_frame, height=5,
+                                                     state='disabled', wrap='word')
+        self.detail_text.grid(row=0, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=2)
         
         # Code snippet display (scrollable text area)
-        ttk.Label(details_frame, text="Code:").grid(row=5, column=0, sticky=tk.NW, pady=2)
+        ttk.Label(details_frame, text="Code:").grid(row=1, column=0, sticky=tk.NW, pady=2)
         self.code_text = scrolledtext.ScrolledText(details_frame, width=70, height=10)
-        self.code_text.grid(row=5, column=1, sticky=(tk.W, tk.E), pady=2)
+        self.code_text.grid(row=1, column=1, sticky=(tk.W, tk.E), pady=2)
+        
+        # Shown only while a long snippet is truncated
+        self.load_full_button = ttk.Button(details_frame, text="Load full snippet",
+                                           command=self.load_full_snippet)
+        self.load_full_button.grid(row=2, column=1, sticky=tk.W, pady=2)
+        self.load_full_button.grid_remove()
         
         # Delete button (only enabled when component selected)
         ttk.Button(details_frame, text="Delete Component", 
                   command=self.delete_selected_component).grid(
-                      row=6, column=0, columnspan=2, pady=(10, 0))
+                      row=3, column=0, columnspan=2, pady=(10, 0))
     
     def on_search_change(self, event=None):
         """
-        Called when search criteria change (typing or filter selection).
-        Triggers refresh of component list.
+        Called on every keystroke in the search box.
+        Debounces the refresh so a burst of typing runs a single search
+        once the user pauses for SEARCH_DEBOUNCE_MS.
+        
+        Args:
+            event: Tkinter event object (optional)
+        """
+        if self._search_after_id:
+            self.root.after_cancel(self._search_after_id)
+        self._search_after_id = self.root.after(SEARCH_DEBOUNCE_MS, self._do_refresh)
+    
+    def on_filter_change(self, event=None):
+        """
+        Called when a pattern/language filter is selected.
+        Selections are discrete, so the list refreshes immediately.
         
         Args:
             event: Tkinter event object (optional)
@@ -172,67 +262,412 @@ class ComponentLibrarianGUI:
         self.refresh_component_list()
     
     def refresh_component_list(self):
+        """
+        Refreshes the component list right away, dropping any pending
+        debounced search (its criteria are included in this refresh).
+        """
+        if self._search_after_id:
+            self.root.after_cancel(self._search_after_id)
+        self._do_refresh()
+    
+    def _do_refresh(self):
         """
         Refreshes the component list based on current search/filter criteria.
-        Queries controller and updates treeview display.
+        Filters the cached components (see _get_all) and updates treeview display.
         """
-        # Clear existing items from treeview
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self._search_after_id = None
         
         # Get current search parameters
         keyword = self.search_var.get()
         pattern_filter = self.pattern_var.get()
         language_filter = self.language_var.get()
         
-        # Search components through Controller
-        components = self.controller.search_components(keyword, pattern_filter, language_filter)
+        # Filter the cached component list in memory; typing in the search
+        # box never goes back to the controller (see _get_all). Each set of
+        # active filters gets its own comprehension, so a row is only tested
+        # against criteria that are actually set; the keyword test then runs
+        # over the (smaller) filtered list.
+        kw = keyword.lower().strip()
+        components = self._get_all()
+        if pattern_filter and language_filter:
+            components = [c for c in components
+                          if c['pattern_name'] == pattern_filter
+                          and c['language'] == language_filter]
+        elif pattern_filter:
+            components = [c for c in components if c['pattern_name'] == pattern_filter]
+        elif language_filter:
+            components = [c for c in components if c['language'] == language_filter]
+        if kw:
+            components = [c for c in components if kw in c['_search_blob']]
+        self._filtered = components
+        
+        # A new result list starts at the top
+        self._first_row = 0
+        self._render_window()
+    
+    def _get_all(self):
+        """
+        Returns every component from the cache. The first call starts
+        loading the cache in the background and returns an empty list;
+        the component list is refreshed again once the load finishes.
         
-        # Add components to treeview
-        for comp in components:
-            # Truncate long descriptions for display
-            description = comp['description']
-            if len(description) > 50:
-                description = description[:50] + "..."
+        Returns:
+            list: All component records as dictionaries
+        """
+        if self._all_cache is None:
+            self._all_cache = []
+            self._reload_all()
+        return self._all_cache
+    
+    def _reload_all(self):
+        """
+        Starts reloading the component cache on the worker thread.
+        The current cache stays in use until the new one arrives; results
+        of any earlier load still in progress are discarded.
+        """
+        self._request_id += 1
+        req_id = self._request_id
+        self._pending_requests += 1
+        
+        future = self._executor.submit(self._load_all)
+        # Called on the worker thread: Tk must not be touched there, so the
+        # future is only handed over to the polling Tk thread
+        future.add_done_callback(lambda f: self._results.put((req_id, f)))
+        
+        if self._poll_after_id is None:
+            self._poll_after_id = self.root.after(RESULT_POLL_MS, self._poll_results)
+    
+    def _load_all(self):
+        """
+        Fetches every component and prepares the derived fields used by
+        the list. Runs on the worker thread, so it reads through
+        list_components, which bypasses the controller's search caches
+        (the Tk thread may clear them meanwhile).
+        
+        Returns:
+            list: All component records as dictionaries
+        """
+        components = [dict(row) for row in self.controller.list_components()]
+        for c in components:
+            # Only name is NOT NULL; rows written by other tools may leave
+            # these empty (NULL)
+            for column in ('pattern_name', 'language', 'description'):
+                if c[column] is None:
+                    c[column] = ''
+            # Lowercased once here rather than on every keystroke
+            c['_search_blob'] = (c['name'] + ' ' + c['description'] + ' ' +
+                                 c['pattern_name']).lower()
+            # Truncate long descriptions for display, also just once
+            description = c['description']
+            c['_display_description'] = (description if len(description) <= 50
+                                         else description[:50] + '...')
+        return components
+    
+    def _poll_results(self):
+        """
+        Hands finished background loads to _apply_results (on the Tk
+        thread) and keeps polling while any are still running.
+        """
+        finished = []
+        while True:
+            try:
+                finished.append(self._results.get_nowait())
+            except queue.Empty:
+                break
+        
+        self._pending_requests -= len(finished)
+        if self._pending_requests:
+            self._poll_after_id = self.root.after(RESULT_POLL_MS, self._poll_results)
+        else:
+            self._poll_after_id = None
+        
+        for req_id, future in finished:
+            try:
+                components = future.result()
+            except Exception as e:
+                # Keep handling the other finished loads; the list keeps
+                # showing the last good cache
+                logger.error("Loading components failed: %s", e)
+                messagebox.showerror("Error", f"Could not load components: {e}")
+                continue
+            self._apply_results(req_id, components)
+    
+    def _apply_results(self, req_id, components):
+        """
+        Installs a freshly loaded component cache and refreshes the list,
+        unless a newer load has been started since (stale result).
+        
+        Args:
+            req_id (int): Request number given by _reload_all
+            components (list): All component records as dictionaries
+        """
+        if req_id != self._request_id:
+            return
+        
+        self._all_cache = components
+        self._component_by_id = {comp['component_id']: comp for comp in components}
+        
+        # Treeview rows of components that no longer exist are deleted,
+        # all in one call
+        gone = [component_id for component_id in self._row_values
+                if component_id not in self._component_by_id]
+        if gone:
+            self.tree.delete(*(str(component_id) for component_id in gone))
+            for component_id in gone:
+                del self._row_values[component_id]
+        
+        self.refresh_component_list()
+    
+    def _visible_row_count(self):
+        """
+        Number of rows that fit in the Treeview, measured from a rendered
+        row when possible, otherwise the Treeview's configured height.
+        
+        Returns:
+            int: Rows in view (at least 1)
+        """
+        children = self.tree.get_children()
+        if children:
+            bbox = self.tree.bbox(children[0])
+            if bbox:
+                # bbox y is the heading height, bbox height is the row height
+                _, heading_height, _, row_height = bbox
+                return max(1, (self.tree.winfo_height() - heading_height) // row_height)
+        return int(self.tree.cget('height'))
+    
+    def _render_window(self):
+        """
+        Fills the Treeview with only the rows currently in view,
+        self._filtered[self._first_row:self._first_row + rows in view],
+        and updates the scrollbar to match the position in the full list.
+        """
+        total = len(self._filtered)
+        rows = self._visible_row_count()
+        self._window_rows = rows
+        
+        # Keep the window inside the list
+        self._first_row = max(0, min(self._first_row, total - rows))
+        last = min(total, self._first_row + rows)
+        
+        # Update the Treeview by difference instead of clearing it: rows
+        # never shown before are created, rows whose data changed are
+        # updated, and the rows in view are then put in place with a single
+        # set_children call (one relayout; rows leaving the view are
+        # detached, kept for reuse)
+        window = self._filtered[self._first_row:last]
+        window_iids = []
+        # New rows are created with the Tcl insert command directly, skipping
+        # Treeview.insert's per-call option processing; tuples passed to
+        # tk.call become proper Tcl lists, so values need no quoting
+        tcl_call = self.tree.tk.call
+        tree_path = str(self.tree)
+        
+        for comp in window:
+            component_id = comp['component_id']
+            
+            values = (comp['name'], comp['pattern_name'], comp['language'],
+                      comp['_display_description'])
             
-            # Insert component into treeview
-            self.tree.insert('', 'end', values=(
-                comp['name'],
-                comp['pattern_name'],
-                comp['language'],
-                description
-            ), tags=(comp['component_id'],))  # Store ID in tags for retrieval
+            iid = str(component_id)
+            shown = self._row_values.get(component_id)
+            if shown is None:
+                # Insert component into treeview (iid is the component ID)
+                tcl_call(tree_path, 'insert', '', 'end', '-id', iid, '-values', values)
+                self._row_values[component_id] = values
+            elif shown != values:
+                # Existing row: refresh its text only if the data changed
+                self.tree.item(iid, values=values)
+                self._row_values[component_id] = values
+            window_iids.append(iid)
+        
+        self.tree.set_children('', *window_iids)
+        
+        # Keep the pool of detached rows bounded
+        if len(self._row_values) > ROW_POOL_WINDOWS * max(rows, 1):
+            in_view = {comp['component_id'] for comp in window}
+            gone = [component_id for component_id in self._row_values
+                    if component_id not in in_view]
+            self.tree.delete(*(str(component_id) for component_id in gone))
+            for component_id in gone:
+                del self._row_values[component_id]
+        
+        # Re-select the chosen component when it scrolls back into view
+        selected_iid = str(self.selected_component_id)
+        if selected_iid in window_iids and selected_iid not in self.tree.selection():
+            self.tree.selection_set(selected_iid)
+        
+        self.tree.yview_moveto(0)
+        if total:
+            self.scrollbar.set(self._first_row / total, last / total)
+        else:
+            self.scrollbar.set(0, 1)
+    
+    def _scroll_to(self, first_row):
+        """
+        Moves the rendered window so it starts at first_row (clamped).
+        
+        Args:
+            first_row (int): Index in self._filtered of the first row to show
+        """
+        first_row = max(0, min(first_row, len(self._filtered) - self._window_rows))
+        if first_row != self._first_row:
+            self._first_row = first_row
+            self._render_window()
+    
+    def on_scrollbar(self, *args):
+        """
+        Scrollbar command: ('moveto', fraction) or ('scroll', n, 'units'/'pages').
+        
+        Args:
+            args: Scrollbar command arguments from Tk
+        """
+        if args[0] == 'moveto':
+            self._scroll_to(int(float(args[1]) * len(self._filtered)))
+        elif args[0] == 'scroll':
+            step = int(args[1])
+            if args[2] == 'pages':
+                step *= self._window_rows
+            self._scroll_to(self._first_row + step)
+    
+    def on_tree_configure(self, event):
+        """
+        Called when the Treeview is resized; renders more or fewer rows
+        if the number that fits has changed.
+        
+        Args:
+            event: Tkinter configure event
+        """
+        if self._visible_row_count() != self._window_rows:
+            self._render_window()
+    
+    def on_tree_wheel(self, event):
+        """
+        Scrolls the component list with the mouse wheel.
+        
+        Args:
+            event: Tkinter mouse wheel / button event
+        """
+        if event.num == 4 or event.delta > 0:
+            self._scroll_to(self._first_row - WHEEL_SCROLL_ROWS)
+        else:
+            self._scroll_to(self._first_row + WHEEL_SCROLL_ROWS)
+        return 'break'
+    
+    def on_tree_arrow(self, event):
+        """
+        Up/Down on the first/last rendered row scrolls the window by one row
+        and moves the selection onto the newly shown row. Anywhere else the
+        Treeview's own keyboard navigation is used.
+        
+        Args:
+            event: Tkinter key event
+        """
+        children = self.tree.get_children()
+        if not children:
+            return None
+        step = 1 if event.keysym == 'Down' else -1
+        edge = children[-1] if step > 0 else children[0]
+        if self.tree.focus() != edge:
+            return None
+        
+        self._scroll_to(self._first_row + step)
+        children = self.tree.get_children()
+        item = children[-1] if step > 0 else children[0]
+        self.tree.focus(item)
+        self.tree.selection_set(item)
+        return 'break'
+    
+    def on_tree_page(self, event):
+        """
+        Page Up/Page Down scroll the component list by one window of rows.
+        
+        Args:
+            event: Tkinter key event
+        """
+        step = self._window_rows if event.keysym == 'Next' else -self._window_rows
+        self._scroll_to(self._first_row + step)
+        return 'break'
     
     def on_component_select(self, event):
         """
         Called when user selects a component in the list.
-        Loads and displays full component details.
+        Schedules the details update for when Tk is idle, so a burst of
+        selections (e.g. holding an arrow key) only loads the last one.
         
         Args:
             event: Tkinter selection event
         """
+        if self._select_after_id:
+            self.root.after_cancel(self._select_after_id)
+        self._select_after_id = self.root.after_idle(self._apply_selection)
+    
+    def _apply_selection(self):
+        """
+        Loads and displays full component details for the selected row.
+        """
+        self._select_after_id = None
+        
         selection = self.tree.selection()
         if selection:
-            # Get selected item and its stored component ID
-            item = selection[0]
-            self.selected_component_id = self.tree.item(item, 'tags')[0]
+            # The selected item's iid is its component ID (see _render_window)
+            new_id = int(selection[0])
             
-            # Get all components and find the selected one
-            components = self.controller.search_components()
-            component = next((comp for comp in components 
-                            if comp['component_id'] == int(self.selected_component_id)), None)
+            # Tk also fires this for focus changes and re-selection after a
+            # refresh; the details already show this component
+            if new_id == self.selected_component_id:
+                return
+            self.selected_component_id = new_id
+            
+            # Fetch the full record by primary key
+            component = self.controller.get_component(new_id)
             
             if component:
-                # Update detail labels with component information
-                self.detail_name.config(text=component['name'])
-                self.detail_pattern.config(text=component['pattern_name'])
-                self.detail_language.config(text=component['language'])
-                self.detail_description.config(text=component['description'])
-                self.detail_author.config(text=f"{component['author']} - {component['date_added']}")
+                # Update detail text with component information
+                self._set_detail_text(
+                    f"Name: {component['name']}\n"
+                    f"Pattern: {component['pattern_name']}\n"
+                    f"Language: {component['language']}\n"
+                    f"Author: {component['author']} - {component['date_added']}\n"
+                    f"Description: {component['description']}")
                 
-                # Display code snippet in scrollable text area
-                self.code_text.delete(1.0, tk.END)  # Clear existing
-                self.code_text.insert(1.0, component['code_snippet'])
+                # Display code snippet in scrollable text area, unless it is
+                # already showing (rewriting a long snippet is not free)
+                snippet = component['code_snippet'] or ''  # NULL from other tools
+                if snippet != self._shown_snippet:
+                    self._show_snippet(snippet)
+    
+    def _show_snippet(self, snippet):
+        """
+        Puts a code snippet in the code area. Snippets longer than
+        CODE_PREVIEW_CHARS are cut there, with the 'Load full snippet'
+        button offered for the rest.
+        
+        Args:
+            snippet (str): Code snippet to display
+        """
+        self.code_text.delete(1.0, tk.END)  # Clear existing
+        if len(snippet) <= CODE_PREVIEW_CHARS:
+            self.code_text.insert(1.0, snippet)
+            self.load_full_button.grid_remove()
+        else:
+            self.code_text.insert(1.0, snippet[:CODE_PREVIEW_CHARS])
+            # Left gravity keeps the mark before the note inserted next, so
+            # load_full_snippet finds the note wherever Tk counts it to be
+            self.code_text.mark_set('truncated', 'end-1c')
+            self.code_text.mark_gravity('truncated', tk.LEFT)
+            self.code_text.insert(tk.END, "\n...(truncated, click 'Load full snippet')")
+            self.load_full_button.grid()
+        self._shown_snippet = snippet
+    
+    def load_full_snippet(self):
+        """
+        Replaces the truncation note in the code area with the rest of
+        the current snippet.
+        """
+        self.code_text.delete('truncated', tk.END)
+        self.code_text.mark_unset('truncated')
+        self.code_text.insert(tk.END, self._shown_snippet[CODE_PREVIEW_CHARS:])
+        self.load_full_button.grid_remove()
     
     def delete_selected_component(self):
         """
@@ -252,6 +687,19 @@ class ComponentLibrarianGUI:
             
             if success:
                 messagebox.showinfo("Success", message)
+                # Drop the deleted component's Treeview row for good
+                component_id = self.selected_component_id
+                if self._row_values.pop(component_id, None) is not None:
+                    self.tree.delete(str(component_id))
+                # The component is gone from the database; drop it from
+                # the cache too instead of reloading everything
+                component = self._component_by_id.pop(component_id, None)
+                if component is not None:
+                    self._all_cache.remove(component)
+                # A load still running may have read the row before it was
+                # deleted; start a fresh one so that result is discarded
+                if self._pending_requests:
+                    self._reload_all()
                 # Refresh list and clear details
                 self.refresh_component_list()
                 self.clear_details()
@@ -261,29 +709,61 @@ class ComponentLibrarianGUI:
     def clear_details(self):
         """
         Clears the details section when no component is selected.
-        Resets all detail labels and text areas.
+        Resets the detail text and code areas.
         """
         self.selected_component_id = None
-        self.detail_name.config(text="")
-        self.detail_pattern.config(text="")
-        self.detail_language.config(text="")
-        self.detail_description.config(text="")
-        self.detail_author.config(text="")
-        self.code_text.delete(1.0, tk.END)
+        self._set_detail_text("")
+        self._show_snippet("")
+    
+    def _set_detail_text(self, text):
+        """
+        Replaces the contents of the read-only detail text widget.
+        
+        Args:
+            text (str): New contents
+        """
+        self.detail_text.configure(state='normal')
+        self.detail_text.delete(1.0, tk.END)
+        self.detail_text.insert(1.0, text)
+        self.detail_text.configure(state='disabled')
     
     def open_add_dialog(self):
         """
         Opens the 'Add New Component' dialog window.
-        Creates a modal dialog for component entry.
+        Creates a modal dialog for component entry the first time; later
+        opens show the same (hidden) dialog again.
         """
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Add New Component")
-        dialog.geometry("600x500")
-        dialog.transient(self.root)  # Set as child of main window
-        dialog.grab_set()  # Make dialog modal
-        
-        # Create add form inside dialog
-        self.create_add_form(dialog)
+        if self._add_dialog is None:
+            dialog = tk.Toplevel(self.root)
+            dialog.title("Add New Component")
+            dialog.geometry("600x500")
+            dialog.transient(self.root)  # Set as child of main window
+            # Closing the window hides it for reuse instead of destroying it
+            dialog.protocol("WM_DELETE_WINDOW", self._close_add_dialog)
+            
+            # Create add form inside dialog
+            self.create_add_form(dialog)
+            self._add_dialog = dialog
+        else:
+            self._add_dialog.deiconify()
+        
+        self._add_dialog.grab_set()  # Make dialog modal
+        self._add_name_entry.focus_set()
+    
+    def _close_add_dialog(self):
+        """
+        Hides the Add Component dialog and clears its fields, ready for
+        the next open_add_dialog.
+        """
+        self._add_dialog.grab_release()
+        self._add_dialog.withdraw()
+        
+        self._add_name_entry.delete(0, tk.END)
+        for var in self._add_vars.values():
+            var.set('')
+        self._add_desc_entry.delete(1.0, tk.END)
+        self._add_code_entry.delete(1.0, tk.END)
+        self._add_author_entry.delete(0, tk.END)
     
     def create_add_form(self, dialog):
         """
@@ -302,6 +782,14 @@ class ComponentLibrarianGUI:
         
         # === FORM FIELDS ===
         
+        # Combobox variables, created once with the dialog and reset by
+        # _close_add_dialog
+        self._add_vars = {
+            'pattern': tk.StringVar(),
+            'category': tk.StringVar(),
+            'language': tk.StringVar(),
+        }
+        
         # Name field (required)
         ttk.Label(main_frame, text="Name:*").grid(row=0, column=0, sticky=tk.W, pady=5)
         name_entry = ttk.Entry(main_frame, width=50)
@@ -309,23 +797,20 @@ class ComponentLibrarianGUI:
         
         # Pattern field (required)
         ttk.Label(main_frame, text="Pattern:*").grid(row=1, column=0, sticky=tk.W, pady=5)
-        pattern_var = tk.StringVar()
-        pattern_combo = ttk.Combobox(main_frame, textvariable=pattern_var, width=47)
-        pattern_combo['values'] = ['Structural', 'Behavioral', 'Creational']
+        pattern_combo = ttk.Combobox(main_frame, textvariable=self._add_vars['pattern'], width=47)
+        pattern_combo['values'] = PATTERN_VALUES[1:]
         pattern_combo.grid(row=1, column=1, sticky=tk.W, pady=5)
         
         # Pattern category field (optional)
         ttk.Label(main_frame, text="Pattern Category:").grid(row=2, column=0, sticky=tk.W, pady=5)
-        category_var = tk.StringVar()
-        category_combo = ttk.Combobox(main_frame, textvariable=category_var, width=47)
-        category_combo['values'] = ['Container', 'Algorithm', 'Utility', 'Security', 'Other']
+        category_combo = ttk.Combobox(main_frame, textvariable=self._add_vars['category'], width=47)
+        category_combo['values'] = CATEGORY_VALUES
         category_combo.grid(row=2, column=1, sticky=tk.W, pady=5)
         
         # Language field (required)
         ttk.Label(main_frame, text="Language:*").grid(row=3, column=0, sticky=tk.W, pady=5)
-        language_var = tk.StringVar()
-        language_combo = ttk.Combobox(main_frame, textvariable=language_var, width=47)
-        language_combo['values'] = ['C', 'C++', 'Python', 'Java', 'JavaScript']
+        language_combo = ttk.Combobox(main_frame, textvariable=self._add_vars['language'], width=47)
+        language_combo['values'] = LANGUAGE_VALUES[1:]
         language_combo.grid(row=3, column=1, sticky=tk.W, pady=5)
         
         # Description field (multi-line, optional)
@@ -343,6 +828,12 @@ class ComponentLibrarianGUI:
         author_entry = ttk.Entry(main_frame, width=50)
         author_entry.grid(row=6, column=1, sticky=tk.W, pady=5)
         
+        # Kept so _close_add_dialog can clear the form for reuse
+        self._add_name_entry = name_entry
+        self._add_desc_entry = desc_entry
+        self._add_code_entry = code_entry
+        self._add_author_entry = author_entry
+        
         # === ACTION BUTTONS ===
         button_frame = ttk.Frame(main_frame)
         button_frame.grid(row=7, column=0, columnspan=2, pady=20)
@@ -353,9 +844,9 @@ class ComponentLibrarianGUI:
             """
             # Get all field values
             name = name_entry.get().strip()
-            pattern = pattern_var.get().strip()
-            category = category_var.get().strip()
-            language = language_var.get().strip()
+            pattern = self._add_vars['pattern'].get().strip()
+            category = self._add_vars['category'].get().strip()
+            language = self._add_vars['language'].get().strip()
             description = desc_entry.get(1.0, tk.END).strip()
             code = code_entry.get(1.0, tk.END).strip()
             author = author_entry.get().strip()
@@ -367,7 +858,8 @@ class ComponentLibrarianGUI:
             
             if success:
                 messagebox.showinfo("Success", message)
-                dialog.destroy()  # Close dialog
+                self._close_add_dialog()  # Hide and clear dialog
+                self._reload_all()  # New component: reload the cached list
                 self.refresh_component_list()  # Refresh main list
             else:
                 messagebox.showerror("Error", message)
@@ -376,7 +868,7 @@ class ComponentLibrarianGUI:
         ttk.Button(button_frame, text="Save Component", 
                   command=save_component).pack(side=tk.LEFT, padx=(0, 10))
         ttk.Button(button_frame, text="Cancel", 
-                  command=dialog.destroy).pack(side=tk.LEFT)
+                  command=self._close_add_dialog).pack(side=tk.LEFT)
 
 
 # === APPLICATION ENTRY POINT ===
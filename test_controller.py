@@ -0,0 +1,58 @@
+"""
+Tests for the Component Controller's search-as-you-type narrowing.
+The in-memory narrowing must return exactly what the database's
+full-text search returns for the same keyword.
+"""
+
+import os
+import tempfile
+import unittest
+
+from controller import ComponentController
+
+
+class NarrowingMatchesFullTextSearchTest(unittest.TestCase):
+    """
+    Types keywords one character at a time (so each search after the
+    first is narrowed in memory) and compares every step with a direct
+    DatabaseManager search.
+    """
+    
+    # Ligatures, accents, '_' separators, digits and full-width letters
+    NAMES = ['café', 'cafe_latte', 'ﬁle', 'file', 'Ｆull', 'naïve', 'ø-ring',
+             'oring', 'v2_node', 'X25519', 'Ångström', 'über', 'u2', 'straße',
+             'strasse', 'ǆungla', 'Ĳssel', 'linked_list', 'alpha-beta',
+             'café ﬁlter', 'über Ｆull', 'x² v2']
+    KEYWORDS = ['café f', 'cafe', 'ﬁ', 'fi', 'Ｆu', 'naive', 'ø', 'v2_n',
+                'v2 n', 'x255', 'angs', 'uber', 'straß', 'dz', 'ǆ', 'ĳ',
+                'lis', '-a', 'beta-al', 'über f', 'x 2']
+    
+    def setUp(self):
+        # The controller opens its database in the working directory
+        self._old_cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        self.controller = ComponentController()
+        for name in self.NAMES:
+            success, message = self.controller.add_component(
+                name, 'Structural', '', 'Python', f'about {name}', 'pass', '')
+            self.assertTrue(success, message)
+    
+    def tearDown(self):
+        self.controller.close()
+        os.chdir(self._old_cwd)
+        self._tmp.cleanup()
+    
+    def test_typed_keywords_match_database(self):
+        for keyword in self.KEYWORDS:
+            self.controller._invalidate_search_cache()
+            for end in range(1, len(keyword) + 1):
+                typed = keyword[:end]
+                with self.subTest(keyword=typed):
+                    narrowed = sorted(c['name'] for c in self.controller.search_components(typed))
+                    expected = sorted(c['name'] for c in self.controller.db.search_components(typed))
+                    self.assertEqual(narrowed, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()